@@ -1,7 +1,7 @@
-from .core import Swarm
+from .core import Swarm, AsyncSwarm, BatchingSwarm
 from .types import Agent, Response
 from .util import function_to_json
 from .util import PATHS
 from .utilities import *
 
-__all__ = ["Swarm", "Agent", "Response"]
+__all__ = ["Swarm", "AsyncSwarm", "BatchingSwarm", "Agent", "Response"]
@@ -1,10 +1,18 @@
+import asyncio
 import copy
+import functools
+import hashlib
+import inspect
 import os
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from collections import defaultdict
 from typing import List
-from litellm import completion
+from weakref import WeakKeyDictionary
+import httpx
+from litellm import completion, acompletion
 import litellm
 from .tasks import Task
 from .util import function_to_json, debug_print, merge_chunk
@@ -29,14 +37,160 @@ from .memory import (
 from swarm.utilities import TaskEvaluation
 
 __CTX_VARS_NAME__ = "context_variables"
+__CACHE_MAX_ENTRIES__ = 128
+__STREAM_BATCH_SIZE__ = 16
+__STREAM_BATCH_WINDOW__ = 0.005  # seconds
+__COMPLETION_ERROR_MESSAGE__ = "Please verify that an API key is provided, or errors may occur due to model limitations."
 litellm.drop_params = True
 
 
+def _is_tool_support_error(error: BaseException) -> bool:
+    """True when a provider error indicates the model rejected tools."""
+    if not isinstance(error, litellm.BadRequestError):
+        return False
+    message = str(error).lower()
+    return "tool" in message or "function" in message
+
+
+def _configure_http_sessions() -> None:
+    """Install pooled HTTP/2 clients for litellm's provider calls.
+
+    Keepalive pooling avoids a TCP/TLS handshake per turn of the run loop,
+    and HTTP/2 lets concurrent completions multiplex one connection.
+    Existing sessions (e.g. configured by the application) are left alone.
+    """
+    limits = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+    timeout = httpx.Timeout(60.0, connect=5.0)
+    if litellm.client_session is None:
+        litellm.client_session = httpx.Client(
+            http2=True, limits=limits, timeout=timeout)
+    if litellm.aclient_session is None:
+        litellm.aclient_session = httpx.AsyncClient(
+            http2=True, limits=limits, timeout=timeout)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_tool_args(arguments: str) -> dict:
+    """Parse a tool-call argument string, memoizing repeated identical calls.
+
+    Callers must deep-copy the result before handing it to a tool: payloads
+    can nest lists/dicts, and tools are free to mutate their arguments.
+    """
+    return json.loads(arguments)
+
+
 class Swarm():
-    def __init__(self, memory: bool = False):
+    def __init__(self, memory: bool = False, cache: str = None,
+                 http2: bool = True):
+        if cache not in (None, "exact"):
+            raise ValueError(
+                "cache must be 'exact' or None.")
         self.memory = memory
+        self.cache = cache
+        if http2:
+            _configure_http_sessions()
+        self._exact_cache = {}
+        self._tools_cache = {}
+        self._function_map_cache = {}
+        self._builder_cache = {}
+        self._ctx_cache = WeakKeyDictionary()
+        self._sys_msg_cache = {}
+        self._model_supports_tools = {}
+        self._tool_executor = None
         self.create_memory()
 
+    def _completion_cache_key(self, create_params: dict) -> str:
+        # hash everything actually sent (including model_config overrides
+        # merged into create_params); stream never varies on the cached path
+        payload = {k: v for k, v in create_params.items() if k != "stream"}
+        return hashlib.blake2b(
+            json.dumps(payload, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _check_completion_cache(self, create_params, stream, debug):
+        """Shared pre-flight for a completion request.
+
+        Looks up the exact-key cache (non-stream only) and strips tools for
+        models already known to reject them, adjusting create_params in
+        place. Returns (cache_key, cached_response); cached_response is None
+        on a miss.
+        """
+        cache_key = None
+        if self.cache == "exact" and not stream:
+            cache_key = self._completion_cache_key(create_params)
+            cached = self._exact_cache.get(cache_key)
+            if cached is not None:
+                debug_print(debug, "Returning cached chat completion.")
+                return cache_key, cached
+
+        # skip tools up front for models already known to reject them
+        model = create_params["model"]
+        if (create_params["tools"]
+                and self._model_supports_tools.get(model) is False):
+            debug_print(
+                debug, "Model", model, "does not support tools; omitting them.")
+            create_params["tools"] = None
+            create_params["tool_choice"] = None
+        return cache_key, None
+
+    def _record_completion_success(self, create_params, cache_key, response):
+        """Shared bookkeeping after a successful completion request."""
+        if create_params["tools"]:
+            self._model_supports_tools[create_params["model"]] = True
+        if cache_key is not None:
+            if len(self._exact_cache) >= __CACHE_MAX_ENTRIES__:
+                self._exact_cache.pop(next(iter(self._exact_cache)))
+            self._exact_cache[cache_key] = response
+        return response
+
+    def _tool_retry_params(self, create_params, error):
+        """Params for a one-shot retry without tools, or None if the failed
+        request is not a candidate for one.
+
+        Only a provider error that actually reports a tool/function
+        limitation qualifies; transient failures (rate limits, auth, network)
+        must not trigger a silent tool-less retry or poison the per-model
+        capability cache."""
+        if not _is_tool_support_error(error):
+            return None
+        if not create_params["tools"]:
+            return None
+        if self._model_supports_tools.get(create_params["model"]) is False:
+            return None
+        retry_params = dict(create_params)
+        retry_params["tools"] = None
+        retry_params["tool_choice"] = None
+        return retry_params
+
+    def _agent_tools(self, agent: Agent) -> List:
+        # rebuild the tool schemas only when agent.functions changes
+        version = (id(agent.functions), len(agent.functions))
+        cached = self._tools_cache.get(id(agent))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        tools = [function_to_json(f) for f in agent.functions]
+        # hide context_variables from model
+        for tool in tools:
+            params = tool["function"]["parameters"]
+            params["properties"].pop(__CTX_VARS_NAME__, None)
+            if __CTX_VARS_NAME__ in params["required"]:
+                params["required"].remove(__CTX_VARS_NAME__)
+
+        self._tools_cache[id(agent)] = (version, tools)
+        return tools
+
+    def _function_map(self, functions: List[AgentFunction]) -> dict:
+        # rebuild the name -> function map only when the list changes
+        version = len(functions)
+        cached = self._function_map_cache.get(id(functions))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        function_map = {f.__name__: f for f in functions}
+        self._function_map_cache[id(functions)] = (version, function_map)
+        return function_map
+
     def create_memory(self):
         if self.memory:
             # NEED TO UPDATE
@@ -66,6 +220,73 @@ class Swarm():
 
         return contextual_memory.build_context_for_task(self.task, context)
 
+    def _make_params_builder(self, agent: Agent):
+        # capture everything static about the agent once; per turn only the
+        # messages, stream flag and any model override still vary
+        base = {
+            "model": agent.model,
+            "messages": None,
+            "tools": self._agent_tools(agent) or None,
+            "tool_choice": agent.tool_choice,
+            "stream": False,
+        }
+        base.update(agent.model_config)
+        # model_config keeps the last word, as with the old dict update
+        overridden = set(agent.model_config)
+        callable_instructions = callable(agent.instructions)
+        static_sys_msg = (
+            None if callable_instructions
+            else {"role": "system", "content": agent.instructions}
+        )
+
+        def build(history, context_variables, model_override, stream, debug):
+            if callable_instructions:
+                instructions = agent.instructions(
+                    defaultdict(str, context_variables))
+                # reuse the same system-message dict while the rendered
+                # instructions text is unchanged
+                sys_msg = self._sys_msg_cache.get(id(agent))
+                if sys_msg is None or sys_msg["content"] != instructions:
+                    sys_msg = {"role": "system", "content": instructions}
+                    self._sys_msg_cache[id(agent)] = sys_msg
+            else:
+                sys_msg = static_sys_msg
+
+            if not agent.model and not model_override:
+                raise ValueError(
+                    "Please provide either the agent model name or model_override.")
+
+            create_params = dict(base)
+            create_params["messages"] = [sys_msg, *history]
+            if "stream" not in overridden:
+                create_params["stream"] = stream
+            if model_override and "model" not in overridden:
+                create_params["model"] = model_override
+            debug_print(debug, "Getting chat completion for...:",
+                        create_params["messages"])
+            return create_params
+
+        return build
+
+    def _prepare_completion_params(
+        self,
+        agent: Agent,
+        history: List,
+        context_variables: dict,
+        model_override: str,
+        stream: bool,
+        debug: bool,
+    ) -> dict:
+        version = (id(agent.functions), len(agent.functions),
+                   id(agent.instructions))
+        cached = self._builder_cache.get(id(agent))
+        if cached is not None and cached[0] == version:
+            builder = cached[1]
+        else:
+            builder = self._make_params_builder(agent)
+            self._builder_cache[id(agent)] = (version, builder)
+        return builder(history, context_variables, model_override, stream, debug)
+
     def get_chat_completion(
         self,
         agent: Agent,
@@ -75,43 +296,29 @@ class Swarm():
         stream: bool,
         debug: bool,
     ) -> ChatCompletionMessage:
-        context_variables = defaultdict(str, context_variables)
-        instructions = (
-            agent.instructions(context_variables)
-            if callable(agent.instructions)
-            else agent.instructions
-        )
-        messages = [{"role": "system", "content": instructions}] + history
-        debug_print(debug, "Getting chat completion for...:", messages)
-
-        tools = [function_to_json(f) for f in agent.functions]
-        # hide context_variables from model
-        for tool in tools:
-            params = tool["function"]["parameters"]
-            params["properties"].pop(__CTX_VARS_NAME__, None)
-            if __CTX_VARS_NAME__ in params["required"]:
-                params["required"].remove(__CTX_VARS_NAME__)
-
-        if not agent.model and not model_override:
-            raise ValueError(
-                "Please provide either the agent model name or model_override.")
-
-        create_params = {
-            "model": model_override or agent.model,
-            "messages": messages,
-            "tools": tools or None,
-            "tool_choice": agent.tool_choice,
-            "stream": stream,
-        }
-        model_config = agent.model_config
-        create_params.update(model_config)
+        create_params = self._prepare_completion_params(
+            agent, history, context_variables, model_override, stream, debug)
+        cache_key, cached = self._check_completion_cache(
+            create_params, stream, debug)
+        if cached is not None:
+            return cached
 
         try:
             response = completion(**create_params)
-            return response
-        except:
-            error_message = "Please verify that an API key is provided, or errors may occur due to model limitations."
-            raise ValueError(error_message)
+            return self._record_completion_success(
+                create_params, cache_key, response)
+        except Exception as error:
+            retry_params = self._tool_retry_params(create_params, error)
+            if retry_params is not None:
+                # the provider reported a tool limitation; retry once without
+                # tools and remember the answer for this model
+                try:
+                    response = completion(**retry_params)
+                    self._model_supports_tools[create_params["model"]] = False
+                    return response
+                except Exception:
+                    pass
+            raise ValueError(__COMPLETION_ERROR_MESSAGE__) from error
 
     def handle_function_result(self, result, debug) -> Result:
         match result:
@@ -131,6 +338,46 @@ class Swarm():
                     debug_print(debug, error_message)
                     raise TypeError(error_message)
 
+    def _run_one_tool(
+        self,
+        tool_call: ChatCompletionMessageToolCall,
+        function_map: dict,
+        context_variables: dict,
+        debug: bool,
+    ):
+        name = tool_call.function.name
+        args = copy.deepcopy(_parse_tool_args(tool_call.function.arguments))
+        debug_print(
+            debug, "Processing tool call:", name, "with arguments", args)
+
+        func = function_map[name]
+        # pass context_variables to agent functions; scan only the true
+        # parameters (not inner locals) and remember the answer per function
+        needs_ctx = self._ctx_cache.get(func)
+        if needs_ctx is None:
+            needs_ctx = __CTX_VARS_NAME__ in func.__code__.co_varnames[
+                :func.__code__.co_argcount]
+            self._ctx_cache[func] = needs_ctx
+        if needs_ctx:
+            args[__CTX_VARS_NAME__] = context_variables
+
+        code = func.__code__
+        valid_params = code.co_varnames[:code.co_argcount]
+        filtered_args = {k: v for k,
+                         v in args.items() if k in valid_params}
+
+        raw_result = func(**filtered_args)
+
+        result: Result = self.handle_function_result(raw_result, debug)
+
+        message = {
+            "role": "tool",
+            "tool_call_id": tool_call.id,
+            "tool_name": name,
+            "content": result.value,
+        }
+        return message, result
+
     def handle_tool_calls(
         self,
         tool_calls: List[ChatCompletionMessageToolCall],
@@ -138,53 +385,57 @@ class Swarm():
         context_variables: dict,
         debug: bool,
     ) -> Response:
-        function_map = {f.__name__: f for f in functions}
+        function_map = self._function_map(functions)
         partial_response = Response(
             messages=[], agent=None, context_variables={})
 
+        # one slot per tool call, filled in the original order
+        entries = []
+        pending = []
         for tool_call in tool_calls:
             name = tool_call.function.name
 
             # handle missing tool case, skip to next tool
             if name not in function_map:
-                debug_print(debug, f"Tool {name} not found in function map.")
-                partial_response.messages.append(
-                    {
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "tool_name": name,
-                        "content": f"Error: Tool {name} not found.",
-                    }
+                debug_print(debug, "Tool", name, "not found in function map.")
+                entries.append(
+                    (
+                        {
+                            "role": "tool",
+                            "tool_call_id": tool_call.id,
+                            "tool_name": name,
+                            "content": f"Error: Tool {name} not found.",
+                        },
+                        None,
+                    )
                 )
                 continue
 
-            args = json.loads(tool_call.function.arguments)
-            debug_print(
-                debug, f"Processing tool call: {name} with arguments {args}")
-
-            func = function_map[name]
-            # pass context_variables to agent functions
-            if __CTX_VARS_NAME__ in func.__code__.co_varnames:
-                args[__CTX_VARS_NAME__] = context_variables
-
-            valid_params = function_map[name].__code__.co_varnames[:
-                                                                   function_map[name].__code__.co_argcount]
-            filtered_args = {k: v for k,
-                             v in args.items() if k in valid_params}
-
-            raw_result = function_map[name](**filtered_args)
-
-            result: Result = self.handle_function_result(raw_result, debug)
+            entries.append(None)
+            pending.append((len(entries) - 1, tool_call))
 
-            partial_response.messages.append(
-                {
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "tool_name": name,
-                    "content": result.value,
-                }
+        max_workers = int(os.getenv("SWARM_TOOL_CONCURRENCY", "1"))
+        if len(pending) > 1 and max_workers > 1:
+            if self._tool_executor is None:
+                self._tool_executor = ThreadPoolExecutor(
+                    max_workers=max_workers)
+            outcomes = self._tool_executor.map(
+                lambda item: self._run_one_tool(
+                    item[1], function_map, context_variables, debug),
+                pending,
             )
+            for (slot, _), outcome in zip(pending, outcomes):
+                entries[slot] = outcome
+        else:
+            for slot, tool_call in pending:
+                entries[slot] = self._run_one_tool(
+                    tool_call, function_map, context_variables, debug)
 
+        # apply results on the main thread so agent switching stays deterministic
+        for message, result in entries:
+            partial_response.messages.append(message)
+            if result is None:
+                continue
             partial_response.context_variables.update(result.context_variables)
             if result.agent:
                 partial_response.agent = result.agent
@@ -200,10 +451,13 @@ class Swarm():
         debug: bool = False,
         max_turns: int = float("inf"),
         execute_tools: bool = True,
+        stream_batch: bool = False,
     ):
         active_agent = agent
-        context_variables = copy.deepcopy(context_variables)
-        history = copy.deepcopy(messages)
+        # history is append-only: shallow-copy each message instead of a
+        # full deepcopy walk of the payload
+        context_variables = dict(context_variables)
+        history = [dict(m) if isinstance(m, dict) else m for m in messages]
         init_len = len(messages)
 
         while len(history) - init_len < max_turns:
@@ -213,13 +467,7 @@ class Swarm():
                 "sender": agent.name,
                 "role": "assistant",
                 "function_call": None,
-                "tool_calls": defaultdict(
-                    lambda: {
-                        "function": {"arguments": "", "name": ""},
-                        "id": "",
-                        "type": "",
-                    }
-                ),
+                "tool_calls": [],
             }
 
             # get completion with current history, agent
@@ -233,18 +481,43 @@ class Swarm():
             )
 
             yield {"delim": "start"}
-            for chunk in completion:
-                delta = json.loads(chunk.choices[0].delta.json())
-                if delta["role"] == "assistant":
-                    delta["sender"] = active_agent.name
-                yield delta
-                delta.pop("role", None)
-                delta.pop("sender", None)
-                merge_chunk(message, delta)
+            if stream_batch:
+                # coalesce deltas into {"batch": [...]} events to cut down
+                # on per-token yields for fast models
+                buffer = []
+                flush_at = time.monotonic() + __STREAM_BATCH_WINDOW__
+                for chunk in completion:
+                    delta = chunk.choices[0].delta.model_dump()
+                    if delta["role"] == "assistant":
+                        delta["sender"] = active_agent.name
+                    buffer.append(delta)
+                    if (len(buffer) >= __STREAM_BATCH_SIZE__
+                            or time.monotonic() >= flush_at):
+                        yield {"batch": buffer}
+                        for delta in buffer:
+                            delta.pop("role", None)
+                            delta.pop("sender", None)
+                            merge_chunk(message, delta)
+                        buffer = []
+                        flush_at = time.monotonic() + __STREAM_BATCH_WINDOW__
+                if buffer:
+                    yield {"batch": buffer}
+                    for delta in buffer:
+                        delta.pop("role", None)
+                        delta.pop("sender", None)
+                        merge_chunk(message, delta)
+            else:
+                for chunk in completion:
+                    # dump straight to a dict; no serialize/parse round-trip
+                    delta = chunk.choices[0].delta.model_dump()
+                    if delta["role"] == "assistant":
+                        delta["sender"] = active_agent.name
+                    yield delta
+                    delta.pop("role", None)
+                    delta.pop("sender", None)
+                    merge_chunk(message, delta)
             yield {"delim": "end"}
 
-            message["tool_calls"] = list(
-                message.get("tool_calls", {}).values())
             if not message["tool_calls"]:
                 message["tool_calls"] = None
             debug_print(debug, "Received completion:", message)
@@ -254,14 +527,15 @@ class Swarm():
                 debug_print(debug, "Ending turn.")
                 break
 
-            # convert tool_calls to objects
+            # convert tool_calls to objects; the data just came off the
+            # stream, so skip pydantic validation via model_construct
             tool_calls = []
             for tool_call in message["tool_calls"]:
-                function = Function(
+                function = Function.model_construct(
                     arguments=tool_call["function"]["arguments"],
                     name=tool_call["function"]["name"],
                 )
-                tool_call_object = ChatCompletionMessageToolCall(
+                tool_call_object = ChatCompletionMessageToolCall.model_construct(
                     id=tool_call["id"], function=function, type=tool_call["type"]
                 )
                 tool_calls.append(tool_call_object)
@@ -293,6 +567,7 @@ class Swarm():
         debug: bool = False,
         max_turns: int = float("inf"),
         execute_tools: bool = True,
+        stream_batch: bool = False,
     ) -> Response:
         self.task = Task(description=messages[-1]["content"])
         context_memory = self._build_context_from_message(messages)
@@ -311,10 +586,13 @@ class Swarm():
                 debug=debug,
                 max_turns=max_turns,
                 execute_tools=execute_tools,
+                stream_batch=stream_batch,
             )
         active_agent = agent
-        context_variables = copy.deepcopy(context_variables)
-        history = copy.deepcopy(messages)
+        # history is append-only: shallow-copy each message instead of a
+        # full deepcopy walk of the payload
+        context_variables = dict(context_variables)
+        history = [dict(m) if isinstance(m, dict) else m for m in messages]
         init_len = len(messages)
 
         while len(history) - init_len < max_turns and active_agent:
@@ -333,9 +611,7 @@ class Swarm():
             debug_print(debug, "Received completion:", message)
             message.sender = active_agent.name
 
-            history.append(
-                json.loads(message.model_dump_json())
-            )
+            history.append(message.model_dump())
 
             if not message.tool_calls or not execute_tools:
                 debug_print(debug, "Ending turn.")
@@ -446,3 +722,402 @@ class Swarm():
                 )
             except Exception as e:
                 print(f"Failed to add to short term memory: {e}")
+
+
+class AsyncSwarm(Swarm):
+    """Async variant of Swarm built on litellm's acompletion.
+
+    Tool functions may be coroutines (awaited directly) or plain callables
+    (dispatched to a worker thread), so many run() invocations can share one
+    event loop while network round-trips and tool I/O are in flight.
+    """
+
+    async def get_chat_completion(
+        self,
+        agent: Agent,
+        history: List,
+        context_variables: dict,
+        model_override: str,
+        stream: bool,
+        debug: bool,
+    ) -> ChatCompletionMessage:
+        create_params = self._prepare_completion_params(
+            agent, history, context_variables, model_override, stream, debug)
+        cache_key, cached = self._check_completion_cache(
+            create_params, stream, debug)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await self._invoke_completion(create_params)
+            return self._record_completion_success(
+                create_params, cache_key, response)
+        except Exception as error:
+            retry_params = self._tool_retry_params(create_params, error)
+            if retry_params is not None:
+                # the provider reported a tool limitation; retry once without
+                # tools and remember the answer for this model
+                try:
+                    response = await self._invoke_completion(retry_params)
+                    self._model_supports_tools[create_params["model"]] = False
+                    return response
+                except Exception:
+                    pass
+            raise ValueError(__COMPLETION_ERROR_MESSAGE__) from error
+
+    async def _invoke_completion(self, create_params: dict):
+        return await acompletion(**create_params)
+
+    async def _run_one_tool(
+        self,
+        tool_call: ChatCompletionMessageToolCall,
+        function_map: dict,
+        context_variables: dict,
+        debug: bool,
+    ):
+        name = tool_call.function.name
+        args = copy.deepcopy(_parse_tool_args(tool_call.function.arguments))
+        debug_print(
+            debug, "Processing tool call:", name, "with arguments", args)
+
+        func = function_map[name]
+        # pass context_variables to agent functions; scan only the true
+        # parameters (not inner locals) and remember the answer per function
+        needs_ctx = self._ctx_cache.get(func)
+        if needs_ctx is None:
+            needs_ctx = __CTX_VARS_NAME__ in func.__code__.co_varnames[
+                :func.__code__.co_argcount]
+            self._ctx_cache[func] = needs_ctx
+        if needs_ctx:
+            args[__CTX_VARS_NAME__] = context_variables
+
+        code = func.__code__
+        valid_params = code.co_varnames[:code.co_argcount]
+        filtered_args = {k: v for k,
+                         v in args.items() if k in valid_params}
+
+        if inspect.iscoroutinefunction(func):
+            raw_result = await func(**filtered_args)
+        else:
+            # keep the event loop hot while sync tools block
+            raw_result = await asyncio.to_thread(func, **filtered_args)
+
+        result: Result = self.handle_function_result(raw_result, debug)
+
+        message = {
+            "role": "tool",
+            "tool_call_id": tool_call.id,
+            "tool_name": name,
+            "content": result.value,
+        }
+        return message, result
+
+    async def handle_tool_calls(
+        self,
+        tool_calls: List[ChatCompletionMessageToolCall],
+        functions: List[AgentFunction],
+        context_variables: dict,
+        debug: bool,
+    ) -> Response:
+        function_map = self._function_map(functions)
+        partial_response = Response(
+            messages=[], agent=None, context_variables={})
+
+        # one slot per tool call, filled in the original order
+        entries = []
+        pending = []
+        for tool_call in tool_calls:
+            name = tool_call.function.name
+
+            # handle missing tool case, skip to next tool
+            if name not in function_map:
+                debug_print(debug, "Tool", name, "not found in function map.")
+                entries.append(
+                    (
+                        {
+                            "role": "tool",
+                            "tool_call_id": tool_call.id,
+                            "tool_name": name,
+                            "content": f"Error: Tool {name} not found.",
+                        },
+                        None,
+                    )
+                )
+                continue
+
+            entries.append(None)
+            pending.append((len(entries) - 1, tool_call))
+
+        outcomes = await asyncio.gather(
+            *[
+                self._run_one_tool(
+                    tool_call, function_map, context_variables, debug)
+                for _, tool_call in pending
+            ]
+        )
+        for (slot, _), outcome in zip(pending, outcomes):
+            entries[slot] = outcome
+
+        # apply results in the original order so agent switching stays
+        # deterministic
+        for message, result in entries:
+            partial_response.messages.append(message)
+            if result is None:
+                continue
+            partial_response.context_variables.update(result.context_variables)
+            if result.agent:
+                partial_response.agent = result.agent
+
+        return partial_response
+
+    async def run_and_stream(
+        self,
+        agent: Agent,
+        messages: List,
+        context_variables: dict = {},
+        model_override: str = None,
+        debug: bool = False,
+        max_turns: int = float("inf"),
+        execute_tools: bool = True,
+        stream_batch: bool = False,
+    ):
+        active_agent = agent
+        # history is append-only: shallow-copy each message instead of a
+        # full deepcopy walk of the payload
+        context_variables = dict(context_variables)
+        history = [dict(m) if isinstance(m, dict) else m for m in messages]
+        init_len = len(messages)
+
+        while len(history) - init_len < max_turns:
+
+            message = {
+                "content": "",
+                "sender": agent.name,
+                "role": "assistant",
+                "function_call": None,
+                "tool_calls": [],
+            }
+
+            # get completion with current history, agent
+            completion = await self.get_chat_completion(
+                agent=active_agent,
+                history=history,
+                context_variables=context_variables,
+                model_override=model_override,
+                stream=True,
+                debug=debug,
+            )
+
+            yield {"delim": "start"}
+            if stream_batch:
+                # coalesce deltas into {"batch": [...]} events to cut down
+                # on per-token yields for fast models
+                buffer = []
+                flush_at = time.monotonic() + __STREAM_BATCH_WINDOW__
+                async for chunk in completion:
+                    delta = chunk.choices[0].delta.model_dump()
+                    if delta["role"] == "assistant":
+                        delta["sender"] = active_agent.name
+                    buffer.append(delta)
+                    if (len(buffer) >= __STREAM_BATCH_SIZE__
+                            or time.monotonic() >= flush_at):
+                        yield {"batch": buffer}
+                        for delta in buffer:
+                            delta.pop("role", None)
+                            delta.pop("sender", None)
+                            merge_chunk(message, delta)
+                        buffer = []
+                        flush_at = time.monotonic() + __STREAM_BATCH_WINDOW__
+                if buffer:
+                    yield {"batch": buffer}
+                    for delta in buffer:
+                        delta.pop("role", None)
+                        delta.pop("sender", None)
+                        merge_chunk(message, delta)
+            else:
+                async for chunk in completion:
+                    # dump straight to a dict; no serialize/parse round-trip
+                    delta = chunk.choices[0].delta.model_dump()
+                    if delta["role"] == "assistant":
+                        delta["sender"] = active_agent.name
+                    yield delta
+                    delta.pop("role", None)
+                    delta.pop("sender", None)
+                    merge_chunk(message, delta)
+            yield {"delim": "end"}
+
+            if not message["tool_calls"]:
+                message["tool_calls"] = None
+            debug_print(debug, "Received completion:", message)
+            history.append(message)
+
+            if not message["tool_calls"] or not execute_tools:
+                debug_print(debug, "Ending turn.")
+                break
+
+            # convert tool_calls to objects; the data just came off the
+            # stream, so skip pydantic validation via model_construct
+            tool_calls = []
+            for tool_call in message["tool_calls"]:
+                function = Function.model_construct(
+                    arguments=tool_call["function"]["arguments"],
+                    name=tool_call["function"]["name"],
+                )
+                tool_call_object = ChatCompletionMessageToolCall.model_construct(
+                    id=tool_call["id"], function=function, type=tool_call["type"]
+                )
+                tool_calls.append(tool_call_object)
+
+            # handle function calls, updating context_variables, and switching agents
+            partial_response = await self.handle_tool_calls(
+                tool_calls, active_agent.functions, context_variables, debug
+            )
+            history.extend(partial_response.messages)
+            context_variables.update(partial_response.context_variables)
+            if partial_response.agent:
+                active_agent = partial_response.agent
+
+        yield {
+            "response": Response(
+                messages=history[init_len:],
+                agent=active_agent,
+                context_variables=context_variables,
+            )
+        }
+
+    async def run(
+        self,
+        agent: Agent,
+        messages: List,
+        context_variables: dict = {},
+        model_override: str = None,
+        stream: bool = False,
+        debug: bool = False,
+        max_turns: int = float("inf"),
+        execute_tools: bool = True,
+        stream_batch: bool = False,
+    ) -> Response:
+        self.task = Task(description=messages[-1]["content"])
+        context_memory = self._build_context_from_message(messages)
+        if context_memory:
+            messages[-1]["content"] += (
+                "Here is the context for the task"
+                f"{context_memory}"
+            )
+
+        if stream:
+            return self.run_and_stream(
+                agent=agent,
+                messages=messages,
+                context_variables=context_variables,
+                model_override=model_override,
+                debug=debug,
+                max_turns=max_turns,
+                execute_tools=execute_tools,
+                stream_batch=stream_batch,
+            )
+        active_agent = agent
+        # history is append-only: shallow-copy each message instead of a
+        # full deepcopy walk of the payload
+        context_variables = dict(context_variables)
+        history = [dict(m) if isinstance(m, dict) else m for m in messages]
+        init_len = len(messages)
+
+        while len(history) - init_len < max_turns and active_agent:
+
+            # get completion with current history, agent
+            completion = await self.get_chat_completion(
+                agent=active_agent,
+                history=history,
+                context_variables=context_variables,
+                model_override=model_override,
+                stream=stream,
+                debug=debug,
+            )
+
+            message = completion.choices[0].message
+            debug_print(debug, "Received completion:", message)
+            message.sender = active_agent.name
+
+            history.append(message.model_dump())
+
+            if not message.tool_calls or not execute_tools:
+                debug_print(debug, "Ending turn.")
+                break
+
+            # handle function calls, updating context_variables, and switching agents
+            partial_response = await self.handle_tool_calls(
+                message.tool_calls, active_agent.functions, context_variables, debug
+            )
+            history.extend(partial_response.messages)
+            context_variables.update(partial_response.context_variables)
+            if partial_response.agent:
+                active_agent = partial_response.agent
+        response = Response(
+            messages=history[init_len:],
+            agent=active_agent,
+            context_variables=context_variables,
+        )
+        if self.memory:
+            self._udpate_long_term_memory(response)
+            # NOTE: consider adding short term memory
+        return response
+
+
+class BatchingSwarm(AsyncSwarm):
+    """AsyncSwarm that coalesces concurrent completion requests.
+
+    Non-streaming requests arriving within batch_window_ms are drained
+    together (up to max_batch_size) and issued in parallel under one
+    asyncio.gather, so simultaneous run() invocations share connection
+    setup instead of each paying their own round-trip overhead.
+    """
+
+    def __init__(
+        self,
+        memory: bool = False,
+        cache: str = None,
+        http2: bool = True,
+        batch_window_ms: int = 20,
+        max_batch_size: int = 16,
+    ):
+        super().__init__(memory=memory, cache=cache, http2=http2)
+        self.batch_window_ms = batch_window_ms
+        self.max_batch_size = max_batch_size
+        self._pending = None
+        self._flush_task = None
+
+    async def _dispatch(self, create_params: dict):
+        if self._pending is None:
+            self._pending = asyncio.Queue()
+        future = asyncio.get_running_loop().create_future()
+        self._pending.put_nowait((create_params, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        return await future
+
+    async def _flush_loop(self):
+        while self._pending is not None and not self._pending.empty():
+            await asyncio.sleep(self.batch_window_ms / 1000)
+            batch = []
+            while (not self._pending.empty()
+                   and len(batch) < self.max_batch_size):
+                batch.append(self._pending.get_nowait())
+            if not batch:
+                continue
+            results = await asyncio.gather(
+                *[acompletion(**params) for params, _ in batch],
+                return_exceptions=True,
+            )
+            for (_, future), result in zip(batch, results):
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    async def _invoke_completion(self, create_params: dict):
+        if create_params["stream"]:
+            # streaming responses start immediately; don't hold them in
+            # the batching window
+            return await acompletion(**create_params)
+        return await self._dispatch(create_params)
@@ -6,28 +6,41 @@ from openai.types.chat.chat_completion_message_tool_call import (
 from typing import List, Callable, Union, Optional
 
 # Third-party imports
-from pydantic import BaseModel
+import msgspec
 
 AgentFunction = Callable[[], Union[str, "Agent", dict]]
 
 
-class Agent(BaseModel):
+class SwarmStruct(msgspec.Struct):
+    """Base struct for swarm types.
+
+    msgspec.Struct instantiation and encoding are considerably cheaper than
+    pydantic's; model_dump is kept as a compatibility shim for callers that
+    still expect the pydantic accessor.
+    """
+
+    def model_dump(self) -> dict:
+        return msgspec.structs.asdict(self)
+
+
+class Agent(SwarmStruct):
     name: str = "Agent"
     model: str = ""
     instructions: Union[str, Callable[[], str]] = "You are a helpful agent."
-    # functions: List = []
     functions: List[AgentFunction] = []
     tool_choice: str = "auto"
     parallel_tool_calls: bool = True
+    # extra per-agent params merged into the completion request
+    model_config: dict = {}
 
 
-class Response(BaseModel):
+class Response(SwarmStruct):
     messages: List = []
     agent: Optional[Agent] = None
     context_variables: dict = {}
 
 
-class Result(BaseModel):
+class Result(SwarmStruct):
     """
     Encapsulates the possible return values for an agent function.
 
@@ -28,7 +28,12 @@ def merge_chunk(final_response: dict, delta: dict) -> None:
     tool_calls = delta.get("tool_calls")
     if tool_calls and len(tool_calls) > 0:
         index = tool_calls[0].pop("index")
-        merge_fields(final_response["tool_calls"][index], tool_calls[0])
+        merged_calls = final_response["tool_calls"]
+        # grow the list lazily as new tool-call indices arrive
+        while len(merged_calls) <= index:
+            merged_calls.append(
+                {"function": {"arguments": "", "name": ""}, "id": "", "type": ""})
+        merge_fields(merged_calls[index], tool_calls[0])
 
 
 def function_to_json(func) -> dict:
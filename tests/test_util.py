@@ -1,4 +1,4 @@
-from swarm.util import function_to_json
+from swarm.util import function_to_json, merge_chunk
 
 
 def test_basic_function():
@@ -48,3 +48,42 @@ def test_complex_function():
             },
         },
     }
+
+
+def test_merge_chunk_grows_tool_call_list():
+    message = {
+        "content": "",
+        "role": "assistant",
+        "tool_calls": [],
+    }
+    merge_chunk(
+        message,
+        {
+            "content": "",
+            "tool_calls": [
+                {
+                    "index": 1,
+                    "id": "tc_1",
+                    "type": "function",
+                    "function": {"name": "get_weather", "arguments": '{"loc'},
+                }
+            ],
+        },
+    )
+    merge_chunk(
+        message,
+        {
+            "content": "",
+            "tool_calls": [
+                {"index": 1, "function": {"arguments": 'ation": "SF"}'}}
+            ],
+        },
+    )
+
+    assert len(message["tool_calls"]) == 2
+    assert message["tool_calls"][0]["id"] == ""
+    assert message["tool_calls"][1] == {
+        "id": "tc_1",
+        "type": "function",
+        "function": {"name": "get_weather", "arguments": '{"location": "SF"}'},
+    }